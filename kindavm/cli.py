@@ -1,11 +1,14 @@
 """Command-line interface for KindaVM."""
 
+import os
 import sys
-from typing import List, cast
+from functools import cache, partial
+from typing import Callable, List
 
-from . import consumer, keyboard, mouse, system
-from .hid import check_device
-from .mouse import ButtonType
+from .hid import HID_DEVICE, HIDDeviceError
+
+# Default UNIX socket path for daemon mode
+DAEMON_SOCKET = "/tmp/kindavm.sock"
 
 
 def print_help() -> None:
@@ -20,6 +23,7 @@ def print_help() -> None:
     print("  kinda mouse click [button]             Click mouse button", file=sys.stderr)
     print("  kinda mouse scroll <amount>            Scroll mouse wheel", file=sys.stderr)
     print("  kinda mouse drag <x> <y> [button]      Drag with button held", file=sys.stderr)
+    print("  kinda daemon [socket]                  Serve commands on a UNIX socket", file=sys.stderr)
     print("", file=sys.stderr)
     print("Special keys:", file=sys.stderr)
     print("  Navigation: f1-f12, esc, home, end, pageup, pagedown, insert, delete,", file=sys.stderr)
@@ -38,28 +42,32 @@ def print_help() -> None:
     print("  kinda raw-key 0x04 0x02", file=sys.stderr)
     print("  kinda mouse move 10 20", file=sys.stderr)
     print("  kinda mouse click right", file=sys.stderr)
+    print(f"  echo 'type hello' | socat - UNIX-CONNECT:{DAEMON_SOCKET}", file=sys.stderr)
 
 
 def cmd_type(args: List[str]) -> int:
     """Handle 'type' command."""
+    from . import keyboard
+
     if not args:
         # Check if reading from pipe/stdin
         if not sys.stdin.isatty():
-            text = sys.stdin.read()
-        else:
-            print("Error: No text provided", file=sys.stderr)
-            print("Usage: kinda type <text>", file=sys.stderr)
-            print("   or: echo 'text' | kinda type", file=sys.stderr)
-            return 1
-    else:
-        text = " ".join(args)
+            # Type line by line as input arrives
+            keyboard.type_chunks(sys.stdin)
+            return 0
+        print("Error: No text provided", file=sys.stderr)
+        print("Usage: kinda type <text>", file=sys.stderr)
+        print("   or: echo 'text' | kinda type", file=sys.stderr)
+        return 1
 
-    keyboard.type_string(text)
+    keyboard.type_string(" ".join(args))
     return 0
 
 
 def cmd_raw_key(args: List[str]) -> int:
     """Handle 'raw-key' command."""
+    from . import keyboard
+
     if not args:
         print("Error: No keycode provided", file=sys.stderr)
         print("Usage: kinda raw-key <keycode> [modifier]", file=sys.stderr)
@@ -70,6 +78,9 @@ def cmd_raw_key(args: List[str]) -> int:
     except ValueError:
         print(f"Error: Invalid keycode: {args[0]}", file=sys.stderr)
         return 1
+    if not 0 <= keycode <= 0xFF:
+        print(f"Error: Keycode out of range (0-255): {args[0]}", file=sys.stderr)
+        return 1
 
     modifier = keyboard.MOD_NONE
     if len(args) > 1:
@@ -78,50 +89,51 @@ def cmd_raw_key(args: List[str]) -> int:
         except ValueError:
             print(f"Error: Invalid modifier: {args[1]}", file=sys.stderr)
             return 1
+        if not 0 <= modifier <= 0xFF:
+            print(f"Error: Modifier out of range (0-255): {args[1]}", file=sys.stderr)
+            return 1
 
     keyboard.send_key(keycode, modifier)
     return 0
 
 
-def cmd_special_key(args: List[str]) -> int:
-    """Handle 'special-key' command for all special keys."""
-    if not args:
-        print("Error: No key specified", file=sys.stderr)
-        print("Usage: kinda special-key <key>", file=sys.stderr)
-        print("See 'kinda help' for available keys", file=sys.stderr)
-        return 1
+@cache
+def _special_keys() -> dict[str, Callable[[], None]]:
+    """Build the map of all special keys to their functions.
 
-    key = args[0].lower()
+    Returns:
+        Map of special key names to functions sending them
+    """
+    from . import consumer, keyboard, system
 
-    # Map of all special keys to their functions
-    special_key_map = {
+    return {
         # Navigation keys (send keyboard keycodes)
-        "esc": lambda: keyboard.send_key(keyboard.KEY_ESCAPE),
-        "f1": lambda: keyboard.send_key(keyboard.KEY_F1),
-        "f2": lambda: keyboard.send_key(keyboard.KEY_F2),
-        "f3": lambda: keyboard.send_key(keyboard.KEY_F3),
-        "f4": lambda: keyboard.send_key(keyboard.KEY_F4),
-        "f5": lambda: keyboard.send_key(keyboard.KEY_F5),
-        "f6": lambda: keyboard.send_key(keyboard.KEY_F6),
-        "f7": lambda: keyboard.send_key(keyboard.KEY_F7),
-        "f8": lambda: keyboard.send_key(keyboard.KEY_F8),
-        "f9": lambda: keyboard.send_key(keyboard.KEY_F9),
-        "f10": lambda: keyboard.send_key(keyboard.KEY_F10),
-        "f11": lambda: keyboard.send_key(keyboard.KEY_F11),
-        "f12": lambda: keyboard.send_key(keyboard.KEY_F12),
-        "printscreen": lambda: keyboard.send_key(keyboard.KEY_PRINT_SCREEN),
-        "scrolllock": lambda: keyboard.send_key(keyboard.KEY_SCROLL_LOCK),
-        "pause": lambda: keyboard.send_key(keyboard.KEY_PAUSE),
-        "insert": lambda: keyboard.send_key(keyboard.KEY_INSERT),
-        "home": lambda: keyboard.send_key(keyboard.KEY_HOME),
-        "pageup": lambda: keyboard.send_key(keyboard.KEY_PAGE_UP),
-        "delete": lambda: keyboard.send_key(keyboard.KEY_DELETE),
-        "end": lambda: keyboard.send_key(keyboard.KEY_END),
-        "pagedown": lambda: keyboard.send_key(keyboard.KEY_PAGE_DOWN),
-        "right": lambda: keyboard.send_key(keyboard.KEY_RIGHT_ARROW),
-        "left": lambda: keyboard.send_key(keyboard.KEY_LEFT_ARROW),
-        "down": lambda: keyboard.send_key(keyboard.KEY_DOWN_ARROW),
-        "up": lambda: keyboard.send_key(keyboard.KEY_UP_ARROW),
+        "esc": partial(keyboard.send_key, keyboard.KEY_ESCAPE),
+        "f1": partial(keyboard.send_key, keyboard.KEY_F1),
+        "f2": partial(keyboard.send_key, keyboard.KEY_F2),
+        "f3": partial(keyboard.send_key, keyboard.KEY_F3),
+        "f4": partial(keyboard.send_key, keyboard.KEY_F4),
+        "f5": partial(keyboard.send_key, keyboard.KEY_F5),
+        "f6": partial(keyboard.send_key, keyboard.KEY_F6),
+        "f7": partial(keyboard.send_key, keyboard.KEY_F7),
+        "f8": partial(keyboard.send_key, keyboard.KEY_F8),
+        "f9": partial(keyboard.send_key, keyboard.KEY_F9),
+        "f10": partial(keyboard.send_key, keyboard.KEY_F10),
+        "f11": partial(keyboard.send_key, keyboard.KEY_F11),
+        "f12": partial(keyboard.send_key, keyboard.KEY_F12),
+        "printscreen": partial(keyboard.send_key, keyboard.KEY_PRINT_SCREEN),
+        "scrolllock": partial(keyboard.send_key, keyboard.KEY_SCROLL_LOCK),
+        "pause": partial(keyboard.send_key, keyboard.KEY_PAUSE),
+        "insert": partial(keyboard.send_key, keyboard.KEY_INSERT),
+        "home": partial(keyboard.send_key, keyboard.KEY_HOME),
+        "pageup": partial(keyboard.send_key, keyboard.KEY_PAGE_UP),
+        "delete": partial(keyboard.send_key, keyboard.KEY_DELETE),
+        "end": partial(keyboard.send_key, keyboard.KEY_END),
+        "pagedown": partial(keyboard.send_key, keyboard.KEY_PAGE_DOWN),
+        "right": partial(keyboard.send_key, keyboard.KEY_RIGHT_ARROW),
+        "left": partial(keyboard.send_key, keyboard.KEY_LEFT_ARROW),
+        "down": partial(keyboard.send_key, keyboard.KEY_DOWN_ARROW),
+        "up": partial(keyboard.send_key, keyboard.KEY_UP_ARROW),
         # Media keys
         "play": consumer.play_pause,
         "next": consumer.next_track,
@@ -140,17 +152,31 @@ def cmd_special_key(args: List[str]) -> int:
         "wake": system.wake,
     }
 
-    if key in special_key_map:
-        special_key_map[key]()
-        return 0
-    else:
+
+def cmd_special_key(args: List[str]) -> int:
+    """Handle 'special-key' command for all special keys."""
+    if not args:
+        print("Error: No key specified", file=sys.stderr)
+        print("Usage: kinda special-key <key>", file=sys.stderr)
+        print("See 'kinda help' for available keys", file=sys.stderr)
+        return 1
+
+    key = args[0].lower()
+
+    fn = _special_keys().get(key)
+    if fn is None:
         print(f"Error: Unknown special key: {key}", file=sys.stderr)
         print("See 'kinda help' for available keys", file=sys.stderr)
         return 1
 
+    fn()
+    return 0
+
 
 def cmd_mouse(args: List[str]) -> int:
     """Handle 'mouse' subcommands."""
+    from . import mouse
+
     if not args:
         print("Error: No mouse command provided", file=sys.stderr)
         print("Usage: kinda mouse <move|click|scroll|drag> [args...]", file=sys.stderr)
@@ -175,11 +201,11 @@ def cmd_mouse(args: List[str]) -> int:
 
     elif subcmd == "click":
         button_str = subargs[0] if subargs else "left"
-        if button_str not in ["left", "right", "middle"]:
+        button_bits = mouse.BUTTON_BITS.get(button_str)
+        if button_bits is None:
             print(f"Error: Invalid button: {button_str}", file=sys.stderr)
             print("Must be 'left', 'right', or 'middle'", file=sys.stderr)
             return 1
-        button = cast(ButtonType, button_str)
         count = 1
         if len(subargs) > 1:
             try:
@@ -187,7 +213,7 @@ def cmd_mouse(args: List[str]) -> int:
             except ValueError:
                 print("Error: count must be an integer", file=sys.stderr)
                 return 1
-        mouse.click(button, count)
+        mouse.click_bits(button_bits, count)
         return 0
 
     elif subcmd == "scroll":
@@ -215,12 +241,12 @@ def cmd_mouse(args: List[str]) -> int:
             print("Error: x and y must be integers", file=sys.stderr)
             return 1
         button_str = subargs[2] if len(subargs) > 2 else "left"
-        if button_str not in ["left", "right", "middle"]:
+        button_bits = mouse.BUTTON_BITS.get(button_str)
+        if button_bits is None:
             print(f"Error: Invalid button: {button_str}", file=sys.stderr)
             print("Must be 'left', 'right', or 'middle'", file=sys.stderr)
             return 1
-        button = cast(ButtonType, button_str)
-        mouse.drag(x, y, button)
+        mouse.drag_bits(x, y, button_bits)
         return 0
 
     else:
@@ -229,37 +255,162 @@ def cmd_mouse(args: List[str]) -> int:
         return 1
 
 
-def main() -> int:
-    """Main entry point for CLI."""
-    if len(sys.argv) < 2:
+def _run_daemon_command(argv: List[str]) -> int:
+    """Run a command received by the daemon.
+
+    Args:
+        argv: Command name followed by its arguments
+
+    Returns:
+        Exit code of the command
+    """
+    if not argv:
+        print("Error: No command provided", file=sys.stderr)
+        return 1
+    if argv[0] == "daemon":
+        print("Error: daemon cannot be run from within the daemon", file=sys.stderr)
+        return 1
+    if argv[0] == "type" and len(argv) == 1:
+        print("Error: No text provided", file=sys.stderr)
+        return 1
+    return _run(argv[0], argv[1:])
+
+
+def cmd_daemon(args: List[str]) -> int:
+    """Handle 'daemon' command."""
+    import contextlib
+    import shlex
+    import signal
+    import socket
+    import socketserver
+    import stat
+
+    class DaemonHandler(socketserver.StreamRequestHandler):
+        """Run newline-separated commands received on a daemon connection."""
+
+        def handle(self) -> None:
+            """Run each received command line and reply with its exit code."""
+            for line in self.rfile:
+                try:
+                    argv = shlex.split(line.decode())
+                except ValueError as e:
+                    print(f"Error: Invalid command line: {e}", file=sys.stderr)
+                    rc = 1
+                else:
+                    # Any failure is reported as this command's exit code so the
+                    # connection keeps answering one line per command
+                    try:
+                        rc = _run_daemon_command(argv)
+                    except Exception as e:
+                        print(f"Error: Command failed: {e}", file=sys.stderr)
+                        rc = 1
+
+                try:
+                    self.wfile.write(f"{rc}\n".encode())
+                except BrokenPipeError:
+                    # The client hung up without waiting for the reply
+                    return
+
+    path = args[0] if args else DAEMON_SOCKET
+
+    # Remove a stale socket left behind by a previous daemon, but never
+    # anything else or the socket of a daemon that is still running
+    if os.path.lexists(path):
+        if not stat.S_ISSOCK(os.lstat(path).st_mode):
+            print(f"Error: {path} exists and is not a socket", file=sys.stderr)
+            return 1
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(path)
+            except ConnectionRefusedError:
+                os.unlink(path)
+            except OSError as e:
+                print(f"Error: Cannot check existing socket {path}: {e.strerror}", file=sys.stderr)
+                return 1
+            else:
+                print(f"Error: Another daemon is already listening on {path}", file=sys.stderr)
+                return 1
+
+    try:
+        server = socketserver.UnixStreamServer(path, DaemonHandler)
+    except OSError as e:
+        print(f"Error: Cannot listen on {path}: {e.strerror}", file=sys.stderr)
+        return 1
+
+    def handle_sigterm(signum: int, frame: object) -> None:
+        """Stop serving on SIGTERM the same way as on Ctrl+C."""
+        raise KeyboardInterrupt
+
+    with server:
+        print(f"Listening on {path}", file=sys.stderr)
+        # Make sure the socket is removed when stopped by kill or a service manager
+        previous_handler = signal.signal(signal.SIGTERM, handle_sigterm)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+    return 0
+
+
+def cmd_help(args: List[str]) -> int:
+    """Handle 'help' command."""
+    print_help()
+    return 0
+
+
+# Map of all commands (and their aliases) to their handlers
+_COMMANDS: dict[str, Callable[[List[str]], int]] = {
+    "type": cmd_type,
+    "special-key": cmd_special_key,
+    "special": cmd_special_key,
+    "raw-key": cmd_raw_key,
+    "key": cmd_raw_key,
+    "mouse": cmd_mouse,
+    "daemon": cmd_daemon,
+    "help": cmd_help,
+    "-h": cmd_help,
+    "--help": cmd_help,
+}
+
+
+def _run(command: str, args: List[str]) -> int:
+    """Run a command.
+
+    Args:
+        command: Command name
+        args: Command arguments
+
+    Returns:
+        Exit code of the command
+    """
+    cmd = _COMMANDS.get(command)
+    if cmd is None:
+        print(f"Error: Unknown command: {command}", file=sys.stderr)
         print_help()
         return 1
 
-    # Check if HID device is available
-    if not check_device():
-        print("Error: HID device not found at /dev/hidg0", file=sys.stderr)
+    # The HID device is opened on first use, so a missing or inaccessible
+    # device surfaces as a HIDDeviceError from the command itself
+    try:
+        return cmd(args)
+    except HIDDeviceError as e:
+        print(f"Error: HID device not available at {HID_DEVICE}: {e.strerror}", file=sys.stderr)
         print("Run 'sudo ./init_hid.sh' to initialize the USB gadget", file=sys.stderr)
         return 1
 
-    command = sys.argv[1]
-    args = sys.argv[2:]
-
-    if command == "type":
-        return cmd_type(args)
-    elif command in ["special-key", "special"]:
-        return cmd_special_key(args)
-    elif command in ["raw-key", "key"]:
-        return cmd_raw_key(args)
-    elif command == "mouse":
-        return cmd_mouse(args)
-    elif command in ["help", "-h", "--help"]:
-        print_help()
-        return 0
-    else:
-        print(f"Error: Unknown command: {command}", file=sys.stderr)
+
+def main() -> int:
+    """Main entry point for CLI."""
+    if len(sys.argv) < 2:
         print_help()
         return 1
 
+    return _run(sys.argv[1], sys.argv[2:])
+
 
 if __name__ == "__main__":
     sys.exit(main())
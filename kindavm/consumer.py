@@ -1,6 +1,8 @@
 """Consumer Control HID functionality (media keys, volume, brightness)."""
 
-from .hid import send_report
+import struct
+
+from .hid import send_reports_batch
 
 # Consumer control button bits (Report ID 2, Byte 1)
 VOLUME_UP = 0x01
@@ -25,6 +27,12 @@ AC_REFRESH = 0x80
 # Consumer control button bits (Report ID 2, Byte 3)
 EJECT = 0x01
 
+# Consumer control report layout: Report ID 2 + 3 bytes of button bits
+_CONSUMER_REPORT = struct.Struct("4B")
+
+# Release report: Report ID 2 with no buttons pressed
+_CONSUMER_RELEASE = bytes([0x02, 0x00, 0x00, 0x00])
+
 
 def send_consumer_key(byte1: int = 0, byte2: int = 0, byte3: int = 0) -> None:
     """Send a consumer control key press and release.
@@ -34,13 +42,9 @@ def send_consumer_key(byte1: int = 0, byte2: int = 0, byte3: int = 0) -> None:
         byte2: Second byte of consumer control bits (brightness, browser)
         byte3: Third byte of consumer control bits (eject)
     """
-    # Press (Report ID 2 + 3 bytes = 4 bytes total)
-    report = bytes([0x02, byte1, byte2, byte3])
-    send_report(report, delay_ms=10)
-
-    # Release (Report ID 2 + 3 bytes = 4 bytes total)
-    report = bytes([0x02, 0x00, 0x00, 0x00])
-    send_report(report, delay_ms=10)
+    # Press and release (Report ID 2 + 3 bytes = 4 bytes total each)
+    press = _CONSUMER_REPORT.pack(0x02, byte1, byte2, byte3)
+    send_reports_batch([press, _CONSUMER_RELEASE], delay_ms=10)
 
 
 def volume_up() -> None:
@@ -1,10 +1,90 @@
 """Core HID report sending functionality."""
 
+import atexit
+import errno
+import os
 import time
-from pathlib import Path
 
 HID_DEVICE = "/dev/hidg0"
 
+# Maximum number of buffers accepted by a single writev call
+_IOV_MAX = os.sysconf("SC_IOV_MAX")
+
+
+class HIDDeviceError(OSError):
+    """Raised when the HID device cannot be opened or written to."""
+
+
+# File descriptor of the HID device, opened on first use and kept for the
+# lifetime of the process
+_hid_fd: int | None = None
+
+
+def _close_device() -> None:
+    """Close the cached HID device file descriptor."""
+    global _hid_fd
+    if _hid_fd is not None:
+        os.close(_hid_fd)
+        _hid_fd = None
+
+
+atexit.register(_close_device)
+
+
+def _get_fd() -> int:
+    """Return the HID device file descriptor, opening it if needed.
+
+    Returns:
+        File descriptor of the HID device opened for writing
+
+    Raises:
+        HIDDeviceError: If the device cannot be opened
+    """
+    global _hid_fd
+    if _hid_fd is None:
+        try:
+            _hid_fd = os.open(HID_DEVICE, os.O_WRONLY)
+        except OSError as e:
+            raise HIDDeviceError(e.errno, e.strerror, HID_DEVICE) from e
+    return _hid_fd
+
+
+def _write_reports(fd: int, reports: list[bytes]) -> None:
+    """Write reports to the device, resubmitting any left over by a short write.
+
+    Args:
+        fd: File descriptor of the HID device
+        reports: The HID reports to write, in order
+
+    The cached descriptor is closed when writing fails, so the device is
+    reopened on the next report (e.g. after the USB gadget is reinitialized).
+
+    Raises:
+        HIDDeviceError: If writing fails, a report is only partially written
+            or nothing is written
+    """
+    while reports:
+        try:
+            # A plain write avoids the iovec setup of writev for a lone report
+            if len(reports) == 1:
+                written = os.write(fd, reports[0])
+            else:
+                written = os.writev(fd, reports)
+        except OSError as e:
+            _close_device()
+            raise HIDDeviceError(e.errno, e.strerror, HID_DEVICE) from e
+
+        # Skip the reports that were written completely
+        done = 0
+        while done < len(reports) and written >= len(reports[done]):
+            written -= len(reports[done])
+            done += 1
+
+        if written or done == 0:
+            _close_device()
+            raise HIDDeviceError(errno.EIO, "Short write of HID report", HID_DEVICE)
+        reports = reports[done:]
+
 
 def send_report(report: bytes, delay_ms: float = 10) -> None:
     """Send a HID report to the device.
@@ -13,18 +93,45 @@ def send_report(report: bytes, delay_ms: float = 10) -> None:
         report: The HID report bytes to send
         delay_ms: Delay in milliseconds after sending the report
     """
-    with open(HID_DEVICE, "rb+") as hid:
-        hid.write(report)
+    _write_reports(_get_fd(), [report])
 
     if delay_ms > 0:
         time.sleep(delay_ms / 1000.0)
 
 
+def send_reports_batch(reports: list[bytes], delay_ms: float = 10, flush_every: int = 0) -> None:
+    """Send multiple HID reports to the device with as few syscalls as possible.
+
+    The reports are submitted with writev. The HID gadget driver handles each
+    buffer as a separate report, blocking until the previous one has been
+    delivered to the host, so the reports do not need pacing in between.
+    Reports must not be concatenated into a single buffer, as the driver
+    truncates every write to the configured report length. The driver also
+    copies each report into its own USB request buffer, so aligning the
+    source buffers (e.g. page-aligned mmap memory) would not save a copy.
+
+    Args:
+        reports: The HID reports to send, in order
+        delay_ms: Delay in milliseconds after sending each chunk of reports
+        flush_every: Maximum number of reports per writev call (0 means no limit)
+    """
+    chunk_size = min(flush_every, _IOV_MAX) if flush_every > 0 else _IOV_MAX
+    fd = _get_fd()
+
+    for start in range(0, len(reports), chunk_size):
+        _write_reports(fd, reports[start : start + chunk_size])
+
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+
+
 def check_device() -> bool:
     """Check if the HID device is available.
 
     Returns:
         True if device exists and is writable, False otherwise
     """
+    from pathlib import Path
+
     device = Path(HID_DEVICE)
     return device.exists() and device.is_char_device()
@@ -1,8 +1,11 @@
 """Keyboard HID functionality."""
 
+import re
+import struct
 import sys
+from collections.abc import Iterable
 
-from .hid import send_report
+from .hid import send_reports_batch
 
 # HID modifier bits
 MOD_NONE = 0x00
@@ -118,6 +121,30 @@ KEY_MAP = {
     "?": (0x38, True),
 }
 
+# Keyboard report layout: Report ID 1 + modifier + reserved + 6 keycodes
+_KB_REPORT = struct.Struct("9B")
+
+# Release report: Report ID 1 with no modifiers and no keys pressed
+_KB_RELEASE = bytes([0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])
+
+# Press reports for KEY_MAP indexed by character ordinal, empty for unmapped characters
+_ASCII_PRESS: list[bytes] = [b""] * 128
+for _char, (_keycode, _needs_shift) in KEY_MAP.items():
+    _ASCII_PRESS[ord(_char)] = _KB_REPORT.pack(
+        0x01, MOD_LEFT_SHIFT if _needs_shift else MOD_NONE, 0x00, _keycode, 0x00, 0x00, 0x00, 0x00, 0x00
+    )
+del _char, _keycode, _needs_shift
+
+# Escape sequences interpreted in typed text
+_ESCAPE_RE = re.compile(r"\\[ntb]")
+_ESCAPE_MAP = {"\\n": "\n", "\\t": "\t", "\\b": "\b"}
+
+# Matches any character not in KEY_MAP
+_UNMAPPED_RE = re.compile("[^" + re.escape("".join(KEY_MAP)) + "]")
+
+# Maximum number of reports type_chunks sends in one writev call
+_TYPE_BATCH_SIZE = 512
+
 # Special key codes (not characters, used with send_key directly)
 KEY_ESCAPE = 0x29
 KEY_F1 = 0x3A
@@ -154,13 +181,9 @@ def send_key(keycode: int, modifier: int = MOD_NONE) -> None:
         keycode: HID keycode to send
         modifier: Modifier keys to apply (default: MOD_NONE)
     """
-    # Press (Report ID 1 + 8 bytes = 9 bytes total)
-    report = bytes([0x01, modifier, 0x00, keycode, 0x00, 0x00, 0x00, 0x00, 0x00])
-    send_report(report, delay_ms=10)
-
-    # Release (Report ID 1 + 8 bytes = 9 bytes total)
-    report = bytes([0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])
-    send_report(report, delay_ms=10)
+    # Press and release (Report ID 1 + 8 bytes = 9 bytes total each)
+    press = _KB_REPORT.pack(0x01, modifier, 0x00, keycode, 0x00, 0x00, 0x00, 0x00, 0x00)
+    send_reports_batch([press, _KB_RELEASE], delay_ms=10)
 
 
 def type_string(text: str) -> None:
@@ -169,14 +192,35 @@ def type_string(text: str) -> None:
     Args:
         text: The text to type (escape sequences like \\n are interpreted)
     """
-    # Process escape sequences
-    text = text.replace("\\n", "\n").replace("\\t", "\t").replace("\\b", "\b")
+    type_chunks((text,))
+
+
+def type_chunks(chunks: Iterable[str]) -> None:
+    """Type text arriving in chunks, sending reports as the chunks are consumed.
+
+    The reports for each chunk are sent as soon as the chunk is consumed, so
+    typing starts before all input is available. Memory use is proportional
+    to the longest chunk rather than the total length of the text.
+
+    Args:
+        chunks: The text to type (escape sequences like \\n are interpreted,
+            and must not be split across chunks)
+    """
+    for text in chunks:
+        # Process escape sequences
+        text = _ESCAPE_RE.sub(lambda m: _ESCAPE_MAP[m.group(0)], text)
+
+        # Drop characters not in the keymap so that every remaining one has a press report
+        unmapped = _UNMAPPED_RE.findall(text)
+        if unmapped:
+            for char in unmapped:
+                print(f"Warning: Character '{char}' not in keymap, skipping", file=sys.stderr)
+            text = _UNMAPPED_RE.sub("", text)
 
-    for char in text:
-        if char not in KEY_MAP:
-            print(f"Warning: Character '{char}' not in keymap, skipping", file=sys.stderr)
-            continue
+        # Interleave press and release reports; the remaining text is ASCII, so
+        # its encoded bytes index the press table directly without a Python loop
+        data = text.encode("ascii")
+        reports = [_KB_RELEASE] * (2 * len(data))
+        reports[0::2] = map(_ASCII_PRESS.__getitem__, data)
 
-        keycode, needs_shift = KEY_MAP[char]
-        modifier = MOD_LEFT_SHIFT if needs_shift else MOD_NONE
-        send_key(keycode, modifier)
+        send_reports_batch(reports, delay_ms=10, flush_every=_TYPE_BATCH_SIZE)
@@ -1,8 +1,10 @@
 """Mouse HID functionality."""
 
+import struct
+from itertools import pairwise
 from typing import Literal
 
-from .hid import send_report
+from .hid import send_report, send_reports_batch
 
 # Mouse button bits
 BUTTON_NONE = 0x00
@@ -12,17 +14,18 @@ BUTTON_MIDDLE = 0x04
 
 ButtonType = Literal["left", "right", "middle"]
 
+# Button names to button bits
+BUTTON_BITS: dict[str, int] = {
+    "left": BUTTON_LEFT,
+    "right": BUTTON_RIGHT,
+    "middle": BUTTON_MIDDLE,
+}
 
-def _clamp_movement(value: int) -> int:
-    """Clamp movement value to valid range (-127 to 127).
+# Mouse report layout: Report ID 4 + buttons + signed x, y and wheel
+_MOUSE_REPORT = struct.Struct("BBbbb")
 
-    Args:
-        value: The movement value to clamp
-
-    Returns:
-        Clamped value in range -127 to 127
-    """
-    return max(-127, min(127, value))
+# Release report: Report ID 4 with no buttons pressed and no movement
+_MOUSE_RELEASE = bytes([0x04, 0x00, 0x00, 0x00, 0x00])
 
 
 def _button_to_bits(button: ButtonType) -> int:
@@ -37,37 +40,46 @@ def _button_to_bits(button: ButtonType) -> int:
     Raises:
         ValueError: If button name is invalid
     """
-    button_map = {
-        "left": BUTTON_LEFT,
-        "right": BUTTON_RIGHT,
-        "middle": BUTTON_MIDDLE,
-    }
-    if button not in button_map:
+    button_bits = BUTTON_BITS.get(button)
+    if button_bits is None:
         raise ValueError(f"Invalid button: {button}. Must be 'left', 'right', or 'middle'")
-    return button_map[button]
+    return button_bits
 
 
-def send_mouse_report(buttons: int = 0, x: int = 0, y: int = 0, wheel: int = 0) -> None:
-    """Send a mouse HID report.
+def _pack_mouse_report(buttons: int, x: int, y: int, wheel: int) -> bytes:
+    """Build a mouse HID report.
 
     Args:
         buttons: Button bits (BUTTON_LEFT, BUTTON_RIGHT, BUTTON_MIDDLE)
         x: X movement (-127 to 127)
         y: Y movement (-127 to 127)
         wheel: Wheel movement (-127 to 127)
-    """
-    x = _clamp_movement(x)
-    y = _clamp_movement(y)
-    wheel = _clamp_movement(wheel)
 
-    # Convert signed values to unsigned bytes
-    x_byte = x & 0xFF
-    y_byte = y & 0xFF
-    wheel_byte = wheel & 0xFF
+    Returns:
+        The 5-byte mouse report
+    """
+    # Clamp movement values to valid range (-127 to 127)
+    if not -127 <= x <= 127:
+        x = 127 if x > 0 else -127
+    if not -127 <= y <= 127:
+        y = 127 if y > 0 else -127
+    if not -127 <= wheel <= 127:
+        wheel = 127 if wheel > 0 else -127
 
     # Report ID 4 + buttons + x + y + wheel = 5 bytes total
-    report = bytes([0x04, buttons, x_byte, y_byte, wheel_byte])
-    send_report(report, delay_ms=10)
+    return _MOUSE_REPORT.pack(0x04, buttons, x, y, wheel)
+
+
+def send_mouse_report(buttons: int = 0, x: int = 0, y: int = 0, wheel: int = 0) -> None:
+    """Send a mouse HID report.
+
+    Args:
+        buttons: Button bits (BUTTON_LEFT, BUTTON_RIGHT, BUTTON_MIDDLE)
+        x: X movement (-127 to 127)
+        y: Y movement (-127 to 127)
+        wheel: Wheel movement (-127 to 127)
+    """
+    send_report(_pack_mouse_report(buttons, x, y, wheel), delay_ms=10)
 
 
 def move(x: int, y: int) -> None:
@@ -87,13 +99,18 @@ def click(button: ButtonType = "left", count: int = 1) -> None:
         button: Button to click ("left", "right", or "middle")
         count: Number of times to click (default: 1)
     """
-    button_bits = _button_to_bits(button)
+    click_bits(_button_to_bits(button), count)
 
-    for _ in range(count):
-        # Press
-        send_mouse_report(buttons=button_bits, x=0, y=0, wheel=0)
-        # Release
-        send_mouse_report(buttons=0, x=0, y=0, wheel=0)
+
+def click_bits(button_bits: int, count: int = 1) -> None:
+    """Click mouse buttons given as button bits.
+
+    Args:
+        button_bits: Button bits (BUTTON_LEFT, BUTTON_RIGHT, BUTTON_MIDDLE)
+        count: Number of times to click (default: 1)
+    """
+    # Press and release for each click, all sent as one batch
+    send_reports_batch([_pack_mouse_report(button_bits, 0, 0, 0), _MOUSE_RELEASE] * count, delay_ms=10)
 
 
 def scroll(amount: int) -> None:
@@ -113,24 +130,37 @@ def drag(x: int, y: int, button: ButtonType = "left") -> None:
         y: Vertical movement (-127 to 127)
         button: Button to hold ("left", "right", or "middle")
     """
-    button_bits = _button_to_bits(button)
+    drag_bits(x, y, _button_to_bits(button))
+
 
-    # Press button
-    send_mouse_report(buttons=button_bits, x=0, y=0, wheel=0)
+def drag_bits(x: int, y: int, button_bits: int) -> None:
+    """Drag the mouse with buttons given as button bits held down.
 
+    Args:
+        x: Horizontal movement (-127 to 127)
+        y: Vertical movement (-127 to 127)
+        button_bits: Button bits (BUTTON_LEFT, BUTTON_RIGHT, BUTTON_MIDDLE)
+    """
     # Move with button held
     # For large movements, break into chunks
     steps = max(abs(x), abs(y))
     if steps == 0:
         steps = 1
 
-    x_step = x / steps
-    y_step = y / steps
-
-    for i in range(steps):
-        step_x = int((i + 1) * x_step) - int(i * x_step)
-        step_y = int((i + 1) * y_step) - int(i * y_step)
-        send_mouse_report(buttons=button_bits, x=step_x, y=step_y, wheel=0)
-
-    # Release button
-    send_mouse_report(buttons=0, x=0, y=0, wheel=0)
+    # Cursor position after each step, truncated towards zero in integer
+    # arithmetic; the per-step movements are the differences between them
+    x_sign = 1 if x >= 0 else -1
+    y_sign = 1 if y >= 0 else -1
+    x_abs = abs(x)
+    y_abs = abs(y)
+    x_pos = [x_sign * (i * x_abs // steps) for i in range(steps + 1)]
+    y_pos = [y_sign * (i * y_abs // steps) for i in range(steps + 1)]
+
+    # Press button, move in steps, release button, all sent as one batch
+    reports = [_pack_mouse_report(button_bits, 0, 0, 0)]
+    reports.extend(
+        _pack_mouse_report(button_bits, x1 - x0, y1 - y0, 0)
+        for (x0, x1), (y0, y1) in zip(pairwise(x_pos), pairwise(y_pos))
+    )
+    reports.append(_MOUSE_RELEASE)
+    send_reports_batch(reports, delay_ms=10)
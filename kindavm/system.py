@@ -1,12 +1,15 @@
 """System Control HID functionality (power, sleep, wake)."""
 
-from .hid import send_report
+from .hid import send_reports_batch
 
 # System control button bits (Report ID 3, Byte 1)
 POWER = 0x01
 SLEEP = 0x02
 WAKE = 0x04
 
+# Release report: Report ID 3 with no buttons pressed
+_SYSTEM_RELEASE = bytes([0x03, 0x00])
+
 
 def send_system_key(buttons: int) -> None:
     """Send a system control key press and release.
@@ -14,13 +17,9 @@ def send_system_key(buttons: int) -> None:
     Args:
         buttons: Bit mask of system control buttons
     """
-    # Press (Report ID 3 + 1 byte = 2 bytes total)
-    report = bytes([0x03, buttons])
-    send_report(report, delay_ms=10)
-
-    # Release (Report ID 3 + 1 byte = 2 bytes total)
-    report = bytes([0x03, 0x00])
-    send_report(report, delay_ms=10)
+    # Press and release (Report ID 3 + 1 byte = 2 bytes total each)
+    press = bytes([0x03, buttons])
+    send_reports_batch([press, _SYSTEM_RELEASE], delay_ms=10)
 
 
 def power() -> None: